@@ -28,13 +28,19 @@ class NodeAPI:
 
     @classmethod
     async def new(
-        cls, host: str, api_key: Optional[str] = None, timeout: Optional[float] = None
+        cls,
+        host: str,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ) -> NodeAPI:
         """
         Args:
             host (str): The host of the node(with the port). E.g. http://veldidina.vos.systems:9928
             api_key (Optional[str], optional): The API key to that node. Defaults to None.
             timeout (Optional[float], optional): The timeout value in seconds. Defaults to None.
+            connector (Optional[aiohttp.BaseConnector], optional): The connector that manages
+                the connections to the node (e.g. to tune the connection pool). Defaults to None.
         """
         headers: Dict[str, str] = {"Content-type": "application/json"}
 
@@ -45,6 +51,7 @@ class NodeAPI:
             base_url=host,
             headers=headers,
             timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=connector,
         )
         return cls(sess)
 
@@ -7,12 +7,35 @@ import time
 from typing import Any, Union, Tuple, List, Optional
 import struct
 
-import base58
+try:
+    # based58 is an optional, natively-implemented drop-in for base58.
+    from based58 import b58encode as _b58encode, b58decode as _b58decode
+except ImportError:
+    from base58 import b58encode as _b58encode, b58decode as _b58decode
 
 from py_vsys import chain as ch
 from py_vsys.utils.crypto import hashes as hs
 from py_vsys.utils.crypto import curve_25519 as curve
 
+_VALID_CHAIN_IDS = frozenset(c.value for c in ch.ChainID)
+_time_ns = time.time_ns
+
+
+def _b58decode_any(s: Union[str, bytes]) -> bytes:
+    """
+    _b58decode_any decodes the given base58 string or bytes,
+    as base58.b58decode accepts both while based58 takes bytes only.
+
+    Args:
+        s (Union[str, bytes]): The base58 string or bytes to decode.
+
+    Returns:
+        bytes: The decoded bytes.
+    """
+    if isinstance(s, str):
+        s = s.encode("latin-1")
+    return _b58decode(s)
+
 
 class Model(abc.ABC):
     """
@@ -23,6 +46,8 @@ class Model(abc.ABC):
     to avoid accidental malformed data as much as possible.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, data: Any) -> None:
         """
         Args:
@@ -55,6 +80,8 @@ class Bytes(Model):
     Bytes is the data model for bytes.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: bytes = b"") -> None:
         """
         Args:
@@ -71,13 +98,11 @@ class Bytes(Model):
         Returns:
             str: The base58 string representation.
         """
-        return base58.b58encode(self.data).decode("latin-1")
+        return _b58encode(self.data).decode("latin-1")
 
     def validate(self) -> None:
-        cls_name = self.__class__.__name__
-
         if not isinstance(self.data, bytes):
-            raise TypeError(f"Data in {cls_name} must be bytes")
+            raise TypeError(f"Data in {self.__class__.__name__} must be bytes")
 
     @classmethod
     def from_b58_str(cls, s: str) -> Bytes:
@@ -90,7 +115,7 @@ class Bytes(Model):
         Returns:
             Bytes: the Bytes instance.
         """
-        return cls(base58.b58decode(s))
+        return cls(_b58decode_any(s))
 
     @classmethod
     def from_str(cls, s: str) -> Bytes:
@@ -110,16 +135,16 @@ class AcntSeedHash(Bytes):
     AcntSeedHash is the data model class for account seed hash.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
     def validate(self) -> None:
         super().validate()
 
-        cls_name = self.__class__.__name__
-
         if len(self.data) != self.BYTES_LEN:
             raise ValueError(
-                f"Data in {cls_name} must be exactly {self.BYTES_LEN} bytes."
+                f"Data in {self.__class__.__name__} must be exactly {self.BYTES_LEN} bytes."
             )
 
     @property
@@ -144,6 +169,8 @@ class Str(Model):
     Str is the data model for string.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: str = "") -> None:
         """
         Args:
@@ -183,20 +210,17 @@ class Str(Model):
         Returns:
             str: The base58 string representation.
         """
-        return base58.b58encode(self.data).decode("latin-1")
+        return _b58encode(self.data.encode("latin-1")).decode("latin-1")
 
     def validate(self) -> None:
-        cls_name = self.__class__.__name__
-
         if not isinstance(self.data, str):
-            raise TypeError(f"Data in {cls_name} must be a str")
+            raise TypeError(f"Data in {self.__class__.__name__} must be a str")
 
 
 class Seed(Str):
-    WORD_CNT = 15
+    __slots__ = ()
 
-    def validate(self) -> None:
-        super().validate()
+    WORD_CNT = 15
 
     def get_acnt_seed_hash(self, nonce: Nonce) -> B58Str:
         """
@@ -209,9 +233,7 @@ class Seed(Str):
             B58Str: The B58Str instance.
         """
         b = hs.sha256_hash(
-            hs.keccak256_hash(
-                hs.blake2b_hash(f"{nonce.data}{self.data}".encode("latin-1"))
-            )
+            hs.keccak256_blake2b_hash(f"{nonce.data}{self.data}".encode("latin-1"))
         )
         return AcntSeedHash(b)
 
@@ -221,6 +243,8 @@ class B58Str(Str):
     B58Str is the data model for base58 string.
     """
 
+    __slots__ = ("_bytes",)
+
     @classmethod
     def from_bytes(cls, b: bytes) -> B58Str:
         """
@@ -232,26 +256,34 @@ class B58Str(Str):
         Returns:
             B58Str: The B58Str instance.
         """
-        return cls(base58.b58encode(b).decode("latin-1"))
+        obj = cls.__new__(cls)
+        obj.data = _b58encode(b).decode("latin-1")
+        # The data is known to decode to b, so validate() skips the base58 decoding.
+        obj._bytes = bytes(b)
+        obj.validate()
+        return obj
 
     @property
     def bytes(self) -> bytes:
         """
         bytes returns the bytes representation of the containing data.
+        The base58 decoding result is cached on validation.
 
         Returns:
             bytes: The bytes representation.
         """
-        return base58.b58decode(self.data)
+        return self._bytes
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
+        if getattr(self, "_bytes", None) is not None:
+            return
         try:
-            self.bytes
+            self._bytes = _b58decode(self.data.encode("latin-1"))
         except ValueError:
-            raise ValueError(f"Data in {cls_name} must be base58-decodable")
+            raise ValueError(
+                f"Data in {self.__class__.__name__} must be base58-decodable"
+            )
 
 
 class FixedSizeB58Str(B58Str):
@@ -259,15 +291,15 @@ class FixedSizeB58Str(B58Str):
     FixedSizeB58Str is the data model for fixed-size base58 string.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 0
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not len(self.bytes) == self.BYTES_LEN:
             raise ValueError(
-                f"Data in {cls_name} must be exactly {self.BYTES_LEN} bytes after base58 decode"
+                f"Data in {self.__class__.__name__} must be exactly {self.BYTES_LEN} bytes after base58 decode"
             )
 
 
@@ -276,6 +308,8 @@ class Addr(FixedSizeB58Str):
     Addr is the data model for an address.
     """
 
+    __slots__ = ("_version", "_chain_id", "_pub_key_hash", "_checksum")
+
     VER = 5
     VER_BYTES_LEN = 1
     CHAIN_ID_BYTES_LEN = 1
@@ -293,7 +327,7 @@ class Addr(FixedSizeB58Str):
         Returns:
             int: The version.
         """
-        return self.bytes[0]
+        return self._version
 
     @property
     def chain_id(self) -> str:
@@ -303,7 +337,7 @@ class Addr(FixedSizeB58Str):
         Returns:
             str: The chain ID.
         """
-        return chr(self.bytes[1])
+        return self._chain_id
 
     @property
     def pub_key_hash(self) -> bytes:
@@ -313,9 +347,7 @@ class Addr(FixedSizeB58Str):
         Returns:
             bytes: The hash.
         """
-        prev_len = self.VER_BYTES_LEN + self.CHAIN_ID_BYTES_LEN
-        b = self.bytes[prev_len:]
-        return b[: self.PUB_KEY_HASH_BYTES_LEN]
+        return self._pub_key_hash
 
     @property
     def checksum(self) -> bytes:
@@ -325,7 +357,7 @@ class Addr(FixedSizeB58Str):
         Returns:
             bytes: The checksum.
         """
-        return self.bytes[-self.CHECKSUM_BYTES_LEN :]
+        return self._checksum
 
     def must_on(self, chain: ch.Chain):
         """
@@ -354,38 +386,40 @@ class Addr(FixedSizeB58Str):
         Returns:
             Addr: The generated address.
         """
-
-        def ke_bla_hash(b: bytes) -> bytes:
-            return hs.keccak256_hash(hs.blake2b_hash(b))
-
         raw_addr: str = (
             chr(cls.VER)
             + chain_id.value
-            + ke_bla_hash(pub_key.bytes).decode("latin-1")[:20]
+            + hs.keccak256_blake2b_hash(pub_key.bytes).decode("latin-1")[:20]
         )
 
-        checksum: str = ke_bla_hash(raw_addr.encode("latin-1")).decode("latin-1")[:4]
+        h = hs.keccak256_blake2b_hash(raw_addr.encode("latin-1"))
+        checksum: str = h.decode("latin-1")[:4]
 
         b = bytes((raw_addr + checksum).encode("latin-1"))
         return cls.from_bytes(b)
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
 
-        if self.version != self.VER:
-            raise ValueError(f"Data in {cls_name} has invalid address version")
+        # Split the address into its fields once so that the properties are plain reads.
+        b = self.bytes
+        prev_len = self.VER_BYTES_LEN + self.CHAIN_ID_BYTES_LEN
+        self._version = b[0]
+        self._chain_id = chr(b[1])
+        self._pub_key_hash = b[prev_len : prev_len + self.PUB_KEY_HASH_BYTES_LEN]
+        self._checksum = b[-self.CHECKSUM_BYTES_LEN :]
 
-        chain_id_valid = any([self.chain_id == c.value for c in ch.ChainID])
-        if not chain_id_valid:
-            raise ValueError(f"Data in {cls_name} has invalid chain_id")
+        if self.version != self.VER:
+            raise ValueError(
+                f"Data in {self.__class__.__name__} has invalid address version"
+            )
 
-        def ke_bla_hash(b: bytes) -> bytes:
-            return hs.keccak256_hash(hs.blake2b_hash(b))
+        if self.chain_id not in _VALID_CHAIN_IDS:
+            raise ValueError(f"Data in {self.__class__.__name__} has invalid chain_id")
 
         cl = self.CHECKSUM_BYTES_LEN
-        if self.checksum != ke_bla_hash(self.bytes[:-cl])[:cl]:
-            raise ValueError(f"Data in {cls_name} has invalid checksum")
+        if self.checksum != hs.keccak256_blake2b_hash(b[:-cl])[:cl]:
+            raise ValueError(f"Data in {self.__class__.__name__} has invalid checksum")
 
     @classmethod
     def from_bytes_md(cls, b: Bytes) -> Addr:
@@ -559,7 +593,7 @@ class CtrtMeta:
         Returns:
             CtrtMeta: The result CtrtMeta object.
         """
-        b = base58.b58decode(b58_str)
+        b = _b58decode_any(b58_str)
         return cls.deserialize(b)
 
     @classmethod
@@ -642,6 +676,8 @@ class CtrtID(FixedSizeB58Str):
     CtrtID is the data model for contract ID.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 26
 
     def get_tok_id(self, tok_idx: int) -> TokenID:
@@ -663,11 +699,9 @@ class CtrtID(FixedSizeB58Str):
             + raw_ctrt_id
             + struct.pack(">I", tok_idx)
         )
-        h = hs.keccak256_hash(hs.blake2b_hash(ctrt_id_no_checksum))
+        h = hs.keccak256_blake2b_hash(ctrt_id_no_checksum)
 
-        tok_id_bytes = base58.b58encode(
-            ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN]
-        )
+        tok_id_bytes = _b58encode(ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN])
 
         tok_id = tok_id_bytes.decode("latin-1")
         return TokenID(tok_id)
@@ -678,6 +712,8 @@ class TokenID(FixedSizeB58Str):
     TokenID is the data model for token ID.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 30
     MAINNET_VSYS_TOK_ID = "TWatCreEv7ayv6iAfLgke6ppVV33kDjFqSJn8yicf"
     TESTNET_VSYS_TOK_ID = "TWuKDNU1SAheHR99s1MbGZLPh1KophEmKk1eeU3mW"
@@ -701,17 +737,15 @@ class TokenID(FixedSizeB58Str):
         Returns:
             CtrtID: The contract ID.
         """
-        b = base58.b58decode(self.data)
+        b = self.bytes
         raw_ctrt_id = b[
             1 : (len(b) - CtrtMeta.TOKEN_IDX_BYTES_LEN - CtrtMeta.CHECKSUM_LEN)
         ]
         ctrt_id_no_checksum = struct.pack("<b", CtrtMeta.CTRT_ADDR_VER) + raw_ctrt_id
 
-        h = hs.keccak256_hash(hs.blake2b_hash(ctrt_id_no_checksum))
+        h = hs.keccak256_blake2b_hash(ctrt_id_no_checksum)
 
-        ctrt_id_bytes = base58.b58encode(
-            ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN]
-        )
+        ctrt_id_bytes = _b58encode(ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN])
         ctrt_id_str = ctrt_id_bytes.decode("latin1")
         return CtrtID(ctrt_id_str)
 
@@ -721,6 +755,8 @@ class TXID(FixedSizeB58Str):
     TXID is the data model for transaction ID.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
 
@@ -729,6 +765,8 @@ class PubKey(FixedSizeB58Str):
     PubKey is the data model for public key.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
     def verify(self, msg: bytes, sig: bytes) -> bool:
@@ -750,6 +788,8 @@ class PriKey(FixedSizeB58Str):
     PriKey is the data model for private key.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
     def sign(self, msg: bytes, rand: Optional[bytes]) -> Bytes:
@@ -772,6 +812,8 @@ class Int(Model):
     Int is the data model for an integer.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: int = 0) -> None:
         """
         Args:
@@ -781,9 +823,8 @@ class Int(Model):
         self.validate()
 
     def validate(self) -> None:
-        cls_name = self.__class__.__name__
         if not isinstance(self.data, int):
-            raise TypeError(f"Data in {cls_name} must be an int")
+            raise TypeError(f"Data in {self.__class__.__name__} must be an int")
 
 
 class NonNegativeInt(Int):
@@ -791,12 +832,12 @@ class NonNegativeInt(Int):
     NonNegativeInt is the data model for a non-negative integer.
     """
 
+    __slots__ = ()
+
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not self.data >= 0:
-            raise ValueError(f"Data in {cls_name} must be non negative")
+            raise ValueError(f"Data in {self.__class__.__name__} must be non negative")
 
 
 class TokenIdx(NonNegativeInt):
@@ -804,7 +845,7 @@ class TokenIdx(NonNegativeInt):
     TokenIdx is the data model for token index.
     """
 
-    pass
+    __slots__ = ()
 
 
 class Nonce(NonNegativeInt):
@@ -812,7 +853,7 @@ class Nonce(NonNegativeInt):
     Nonce is the data model for nonce (used with seed for an account).
     """
 
-    pass
+    __slots__ = ()
 
 
 class VSYSTimestamp(NonNegativeInt):
@@ -820,6 +861,8 @@ class VSYSTimestamp(NonNegativeInt):
     VSYSTimestamp is the data model for the timestamp used in VSYS.
     """
 
+    __slots__ = ()
+
     SCALE = 1_000_000_000
 
     @classmethod
@@ -837,7 +880,9 @@ class VSYSTimestamp(NonNegativeInt):
         Returns:
             VSYSTimestamp: The VSYSTimestamp.
         """
-        if not (isinstance(ux_ts, int) or isinstance(ux_ts, float)):
+        if isinstance(ux_ts, int):
+            return cls(ux_ts * cls.SCALE)
+        if not isinstance(ux_ts, float):
             raise TypeError("ux_ts must be an int or float")
 
         return cls(int(ux_ts * cls.SCALE))
@@ -850,7 +895,8 @@ class VSYSTimestamp(NonNegativeInt):
         Returns:
             VSYSTimestamp: The VSYSTimestamp.
         """
-        return cls(int(time.time() * cls.SCALE))
+        # SCALE is 10^9, so nanoseconds since the epoch need no float round trip.
+        return cls(_time_ns())
 
     @property
     def unix_ts(self) -> float:
@@ -858,11 +904,9 @@ class VSYSTimestamp(NonNegativeInt):
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not (self.data == 0 or self.data >= self.SCALE):
             raise ValueError(
-                f"Data in {cls_name} must be either be 0 or equal or greater than {self.SCALE}"
+                f"Data in {self.__class__.__name__} must be either be 0 or equal or greater than {self.SCALE}"
             )
 
 
@@ -871,6 +915,8 @@ class Token(NonNegativeInt):
     Token is the data model for tokens.
     """
 
+    __slots__ = ("unit",)
+
     def __init__(self, data: int = 0, unit: int = 0) -> None:
         """
         Args:
@@ -916,6 +962,8 @@ class VSYS(NonNegativeInt):
     VSYS is the data model for VSYS(the native token on VSYS blockchain).
     """
 
+    __slots__ = ()
+
     UNIT = 1_00_000_000
 
     @property
@@ -971,6 +1019,8 @@ class Fee(VSYS):
     Fee is the data model for transaction fee.
     """
 
+    __slots__ = ()
+
     DEFAULT = int(VSYS.UNIT * 0.1)
 
     def __init__(self, data: int = 0) -> None:
@@ -978,17 +1028,13 @@ class Fee(VSYS):
         Args:
             data (int, optional): The data to contain. Defaults to VSYS.UNIT * 0.1.
         """
-        if data == 0:
-            data = self.DEFAULT
-        super().__init__(data)
+        super().__init__(self.DEFAULT if data == 0 else data)
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not self.data >= self.DEFAULT:
             raise ValueError(
-                f"Data in {cls_name} must be equal or greater than {self.DEFAULT}"
+                f"Data in {self.__class__.__name__} must be equal or greater than {self.DEFAULT}"
             )
 
 
@@ -997,7 +1043,7 @@ class PaymentFee(Fee):
     PaymentFee is the data model for the fee of a transaction where the type is Payment.
     """
 
-    pass
+    __slots__ = ()
 
 
 class LeasingFee(Fee):
@@ -1005,7 +1051,7 @@ class LeasingFee(Fee):
     LeasingFee is the data model for the fee of a transaction where the type is Leasing.
     """
 
-    pass
+    __slots__ = ()
 
 
 class LeasingCancelFee(Fee):
@@ -1013,7 +1059,7 @@ class LeasingCancelFee(Fee):
     LeasingCancelFee is the data model for the fee of a transaction where the type is Leasing Cancel.
     """
 
-    pass
+    __slots__ = ()
 
 
 class RegCtrtFee(Fee):
@@ -1021,6 +1067,8 @@ class RegCtrtFee(Fee):
     RegCtrtFee is the data model for the fee of a transaction where the type is Register Contract.
     """
 
+    __slots__ = ()
+
     DEFAULT = VSYS.UNIT * 100
 
 
@@ -1029,6 +1077,8 @@ class ExecCtrtFee(Fee):
     ExecCtrtFee is the data model for the fee of a transaction where the type is Execute Contract.
     """
 
+    __slots__ = ()
+
     DEFAULT = int(VSYS.UNIT * 0.3)
 
 
@@ -1037,6 +1087,8 @@ class ContendSlotsFee(Fee):
     ContendSlotsFee is the data model for the fee of a transaction where the type is Contend Slots.
     """
 
+    __slots__ = ()
+
     DEFAULT = VSYS.UNIT * 50_000
 
 
@@ -1045,6 +1097,8 @@ class DBPutFee(Fee):
     DBPutFee is the data model for the fee of a transaction where the type is DB Put.
     """
 
+    __slots__ = ()
+
     DEFAULT = VSYS.UNIT
 
 
@@ -1053,6 +1107,8 @@ class Bool(Model):
     Bool is the data model for a boolean value.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: bool = False) -> None:
         """
         Args:
@@ -1062,10 +1118,8 @@ class Bool(Model):
         self.validate()
 
     def validate(self) -> None:
-        cls_name = self.__class__.__name__
-
         if not isinstance(self.data, bool):
-            raise TypeError(f"Data in {cls_name} must be a bool")
+            raise TypeError(f"Data in {self.__class__.__name__} must be a bool")
 
 
 class KeyPair:
@@ -8,6 +8,11 @@ from typing import Tuple, List
 
 from py_vsys.utils.crypto import hashes as hs
 
+try:
+    from nacl import bindings as _nacl
+except ImportError:  # pynacl is an optional dependency
+    _nacl = None
+
 
 BASE_FIELD_Z_P = 2**255 - 19
 
@@ -17,11 +22,18 @@ def modp_inv(x: int) -> int:
 
 
 CURVE_CONST_D = -121665 * modp_inv(121666) % BASE_FIELD_Z_P
+_D_TIMES_2 = 2 * CURVE_CONST_D % BASE_FIELD_Z_P
+# The square root of -1 modulo BASE_FIELD_Z_P.
+_MODP_SQRT_M1 = pow(2, (BASE_FIELD_Z_P - 1) // 4, BASE_FIELD_Z_P)
 GROUP_ORDER_Q = 2**252 + 27742317777372353535851937790883648493
 
 
+_sha512 = hs.sha512_hash
+_from_bytes = int.from_bytes
+
+
 def sha512_modq(s: bytes) -> int:
-    return int.from_bytes(hs.sha512_hash(s), "little") % GROUP_ORDER_Q
+    return _from_bytes(_sha512(s), "little") % GROUP_ORDER_Q
 
 
 # "Point" is represented as a 4-element-tuple for performance purposes.
@@ -45,14 +57,52 @@ def point_add(P: "Point", Q: "Point") -> "Point":
     A = (PY - PX) * (QY - QX) % BASE_FIELD_Z_P
     B = (PY + PX) * (QY + QX) % BASE_FIELD_Z_P
 
-    C = 2 * PT * QT * CURVE_CONST_D % BASE_FIELD_Z_P
+    C = PT * QT * _D_TIMES_2 % BASE_FIELD_Z_P
     D = 2 * PZ * QZ % BASE_FIELD_Z_P
     E = B - A
     F = D - C
     G = D + C
     H = B + A
-    
-    return (E * F, G * H, F * G, E * H)
+
+    # Reduce the coordinates so that the operands of subsequent additions
+    # stay within the 255-bit field instead of growing with each call.
+    return (
+        E * F % BASE_FIELD_Z_P,
+        G * H % BASE_FIELD_Z_P,
+        F * G % BASE_FIELD_Z_P,
+        E * H % BASE_FIELD_Z_P,
+    )
+
+
+def _point_double(P: "Point") -> "Point":
+    """
+    _point_double doubles the given Point P.
+    It is equivalent to point_add(P, P) but takes 4 multiplications and 4 squarings
+    instead of 9 multiplications.
+
+    Args:
+        P (Point): The Point p.
+
+    Returns:
+        Point: The result Point.
+    """
+    PX, PY, PZ, PT = P
+
+    A = PX * PX % BASE_FIELD_Z_P
+    B = PY * PY % BASE_FIELD_Z_P
+    C = 2 * PZ * PZ % BASE_FIELD_Z_P
+    H = A + B
+    XY = PX + PY
+    E = H - XY * XY
+    G = A - B
+    F = C + G
+
+    return (
+        E * F % BASE_FIELD_Z_P,
+        G * H % BASE_FIELD_Z_P,
+        F * G % BASE_FIELD_Z_P,
+        E * H % BASE_FIELD_Z_P,
+    )
 
 
 def point_mul(s: int, P: "Point") -> "Point":
@@ -70,7 +120,7 @@ def point_mul(s: int, P: "Point") -> "Point":
     while s > 0:
         if s & 1:
             Q = point_add(Q, P)
-        P = point_add(P, P)
+        P = _point_double(P)
         s >>= 1
     return Q
 
@@ -175,13 +225,10 @@ def point_recover_x(y: int, sign: int) -> int:
         if sign:
             raise ValueError("Invalid x2 & sign")
         return 0
-    
-    # square root of -1 that mod 
-    modp_sqrt_m1 = pow(2, (BASE_FIELD_Z_P - 1) // 4, BASE_FIELD_Z_P)
 
     x = pow(x2, (BASE_FIELD_Z_P + 3) // 8, BASE_FIELD_Z_P)
     if (x * x - x2) % BASE_FIELD_Z_P != 0:
-        x = x * modp_sqrt_m1 % BASE_FIELD_Z_P
+        x = x * _MODP_SQRT_M1 % BASE_FIELD_Z_P
 
     if (x * x - x2) % BASE_FIELD_Z_P != 0:
         raise ValueError("Invalid x")
@@ -203,19 +250,184 @@ G = (
 )
 
 
+def _point_to_cached(P: "Point") -> "Point":
+    """
+    _point_to_cached converts the given Point to the form (Y-X, Y+X, 2*d*T, 2*Z)
+    consumed by _point_add_cached.
+
+    Args:
+        P (Point): The Point to convert.
+
+    Returns:
+        Point: The converted Point.
+    """
+    PX, PY, PZ, PT = P
+    return (
+        (PY - PX) % BASE_FIELD_Z_P,
+        (PY + PX) % BASE_FIELD_Z_P,
+        _D_TIMES_2 * PT % BASE_FIELD_Z_P,
+        2 * PZ % BASE_FIELD_Z_P,
+    )
+
+
+def _point_add_cached(P: "Point", Qc: "Point") -> "Point":
+    """
+    _point_add_cached adds the given Point P & the Point Qc converted by _point_to_cached.
+    Since the terms depending only on Q are precomputed, it saves the additions &
+    multiplications by constants that point_add spends on them.
+
+    Args:
+        P (Point): The Point p.
+        Qc (Point): The converted Point q.
+
+    Returns:
+        Point: The result Point.
+    """
+    PX, PY, PZ, PT = P
+    QYmX, QYpX, QT2d, QZ2 = Qc
+
+    A = (PY - PX) * QYmX % BASE_FIELD_Z_P
+    B = (PY + PX) * QYpX % BASE_FIELD_Z_P
+    C = PT * QT2d % BASE_FIELD_Z_P
+    D = PZ * QZ2 % BASE_FIELD_Z_P
+    E = B - A
+    F = D - C
+    G = D + C
+    H = B + A
+
+    return (
+        E * F % BASE_FIELD_Z_P,
+        G * H % BASE_FIELD_Z_P,
+        F * G % BASE_FIELD_Z_P,
+        E * H % BASE_FIELD_Z_P,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_g_table() -> Tuple[Tuple["Point", ...], ...]:
+    """
+    _get_g_table returns the table of precomputed multiples of the base point G
+    used by _point_mul_base. The i-th row holds k * 16^i * G for k in [0, 16)
+    in the form produced by _point_to_cached.
+    The table is built once on first use.
+
+    Returns:
+        Tuple[Tuple[Point, ...], ...]: The table.
+    """
+    rows = []
+    base = G
+    for _ in range(64):
+        row = [(0, 1, 1, 0), base]
+        for _ in range(14):
+            row.append(point_add(row[-1], base))
+        rows.append(tuple(_point_to_cached(P) for P in row))
+        base = point_add(row[-1], base)
+    return tuple(rows)
+
+
+def _point_mul_base(s: int) -> "Point":
+    """
+    _point_mul_base multiplies the base point G with the number.
+    It walks the number in 4-bit windows over a precomputed table, which takes
+    about 64 point additions instead of the ~380 of point_mul.
+
+    Args:
+        s (int): The number.
+
+    Returns:
+        Point: The result Point.
+    """
+    # G has the order GROUP_ORDER_Q, so reducing s keeps it within 64 windows.
+    s %= GROUP_ORDER_Q
+
+    Q = (0, 1, 1, 0)  # Neutral element
+    for row in _get_g_table():
+        if s == 0:
+            break
+        nibble = s & 0xF
+        if nibble:
+            Q = _point_add_cached(Q, row[nibble])
+        s >>= 4
+    return Q
+
+
+def _point_mul_base_compress(s: int) -> bytes:
+    """
+    _point_mul_base_compress multiplies the base point G with the number and compresses the result.
+    It is offloaded to libsodium when pynacl is installed.
+
+    Args:
+        s (int): The number.
+
+    Returns:
+        bytes: The compression result.
+    """
+    s %= GROUP_ORDER_Q
+
+    # libsodium refuses to produce the neutral element, i.e. when s == 0.
+    if _nacl is None or s == 0:
+        return point_compress(_point_mul_base(s))
+    return _nacl.crypto_scalarmult_ed25519_base_noclamp(int.to_bytes(s, 32, "little"))
+
+
+# The 32-byte domain-separation prefixes hashed in get_r & get_x respectively.
+_PREFIX_R = b"\xfe" + b"\xff" * 31
+_PREFIX_X = b"\xfd" + b"\xff" * 31
+
+
+def _point_sum(Ps: Tuple["Point", ...]) -> "Point":
+    """
+    _point_sum adds up the given Points.
+
+    Args:
+        Ps (Tuple[Point, ...]): The Points to add up.
+
+    Returns:
+        Point: The sum.
+    """
+    if len(Ps) == 1:
+        return Ps[0]
+
+    acc = Ps[0]
+    for P in Ps[1:]:
+        acc = point_add(acc, P)
+    return acc
+
+
 class MultiSignPriKey:
     """
     MultiSignPriKey is the private key used by one party participated into the multi-sign procedure.
     """
+
+    __slots__ = ("pri_key", "a", "A", "_pub_key", "_x_cache", "_xA_cache")
+
     def __init__(self, pri_key: bytes) -> None:
         """
         Args:
             pri_key (bytes): The private key in bytes.
         """
+        if len(pri_key) != 32:
+            raise ValueError("Bad size of private key")
         self.pri_key = pri_key
         self.a = self.get_a()
         self.A = self.get_A()
-        self.pub_key = self.get_pub_key()
+        self._pub_key = None
+        # x & xA are fully determined by allAs for a given key.
+        self._x_cache = {}
+        self._xA_cache = {}
+
+    @property
+    def pub_key(self) -> bytes:
+        """
+        pub_key returns the public key of the private key.
+        It is derived on first access as only the multisign account needs it.
+
+        Returns:
+            bytes: The public key.
+        """
+        if self._pub_key is None:
+            self._pub_key = self.get_pub_key()
+        return self._pub_key
 
     def get_a(self) -> int:
         """
@@ -227,19 +439,17 @@ class MultiSignPriKey:
         """
         get_A returns the variable A used in XEdDSA calculation.
         """
-        return point_compress(point_mul(self.a, G))
+        return _point_mul_base_compress(self.a)
 
     def get_pub_key(self) -> bytes:
         """
         get_pub_key returns the public key of the private key.
         """
-        if (len(self.pri_key) != 32):
-            raise ValueError("Bad size of private key")
         h = hs.sha512_hash(self.pri_key)
         a = int.from_bytes(h[:32], "little")
         a &= (1 << 254) - 8
         a |= (1 << 254)
-        return point_compress(point_mul(a, G))
+        return _point_mul_base_compress(a)
 
     def get_r(self, msg: bytes, rand: bytes) -> int:
         """
@@ -252,13 +462,7 @@ class MultiSignPriKey:
         Returns:
             int: The variable r.
         """
-        prefix = 0xFE
-        for _ in range(0, 31):
-            prefix *= 256
-            prefix += 0xFF
-        
-        prefix = int.to_bytes(prefix, 32, "big")
-        return sha512_modq(prefix + self.pri_key + msg + rand)
+        return sha512_modq(_PREFIX_R + self.pri_key + msg + rand)
     
     def get_R(self, msg: bytes, rand: bytes) -> "Point":
         """
@@ -272,7 +476,7 @@ class MultiSignPriKey:
             Point: The variable R.
         """
         r = self.get_r(msg, rand)
-        return point_mul(r, G)
+        return _point_mul_base(r)
 
     def get_x(self, *allAs: Tuple[bytes]) -> int:
         """
@@ -287,19 +491,10 @@ class MultiSignPriKey:
         if len(allAs) == 1:
             return 1
 
-        prefix = 0xFD
-        for _ in range(0, 31):
-            prefix *= 256
-            prefix += 0xFF
-        prefix = int.to_bytes(prefix, 32, 'big')
-
-        A = self.A
-        b = prefix + A
-
-        for Ai in allAs:
-            b += Ai
-        
-        return sha512_modq(b)
+        x = self._x_cache.get(allAs)
+        if x is None:
+            x = self._x_cache[allAs] = sha512_modq(_PREFIX_X + self.A + b"".join(allAs))
+        return x
     
     def get_bpA(self, *allAs: Tuple[bytes]) -> "Point":
         """
@@ -311,8 +506,8 @@ class MultiSignPriKey:
         Returns:
             Point: The variable bpA.
         """
-        x = self.get_x(*allAs)
-        return point_mul((x * self.a) % GROUP_ORDER_Q, G)
+        # _point_mul_base reduces the scalar modulo GROUP_ORDER_Q, so bpA equals xA.
+        return self.get_xA(*allAs)
 
     def get_xA(self, *allAs: Tuple[bytes]) -> "Point":
         """
@@ -324,8 +519,11 @@ class MultiSignPriKey:
         Returns:
             Point: The variable xA.
         """
-        x = self.get_x(*allAs)
-        return point_mul((x * self.a), G)
+        xA = self._xA_cache.get(allAs)
+        if xA is None:
+            x = self.get_x(*allAs)
+            xA = self._xA_cache[allAs] = _point_mul_base(x * self.a)
+        return xA
 
     def sign(self, msg: bytes, rand: bytes, unionA: bytes, unionR: "Point", allAs: Tuple[bytes]) -> int:
         """
@@ -364,9 +562,7 @@ class MultiSign:
         Returns:
             bytes: The unionA.
         """
-        return point_compress(
-            functools.reduce(lambda a, b: point_add(a, b), xAs)
-        )
+        return point_compress(_point_sum(xAs))
 
     @staticmethod
     def get_unionR(*Rs: Tuple["Point"]) -> "Point":
@@ -379,7 +575,7 @@ class MultiSign:
         Returns:
             Point: The unionR.
         """
-        return functools.reduce(lambda a, b: point_add(a, b), Rs) 
+        return _point_sum(Rs)
 
     @staticmethod 
     def _transfer_sig(sig: int, A: bytes) -> List[int]:
@@ -424,9 +620,11 @@ class MultiSign:
         Returns:
             bytes: The public key.
         """
-        p = functools.reduce(lambda a, b: point_add(a, b), bpAs)
-
-        zinv = modp_inv(p[2])
-        py = p[1] * zinv % BASE_FIELD_Z_P
+        p = _point_sum(bpAs)
 
-        return int.to_bytes((py + 1) * modp_inv(1  - py) % BASE_FIELD_Z_P, 32, 'little')
+        # The Montgomery u-coordinate (1 + y) / (1 - y) with y = Y / Z
+        # equals (Z + Y) / (Z - Y), which needs a single inversion.
+        PY, PZ = p[1], p[2]
+        return int.to_bytes(
+            (PZ + PY) * modp_inv(PZ - PY) % BASE_FIELD_Z_P, 32, "little"
+        )
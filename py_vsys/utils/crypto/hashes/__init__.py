@@ -5,6 +5,8 @@ hashes contains utility functions related to hashing
 import hashlib
 from tiny_keccak import keccak256
 
+_blake2b = hashlib.blake2b
+
 
 def sha256_hash(b: bytes) -> bytes:
     """
@@ -57,3 +59,18 @@ def blake2b_hash(b: bytes) -> bytes:
         bytes: The hash result
     """
     return hashlib.blake2b(b, digest_size=32).digest()
+
+
+def keccak256_blake2b_hash(b: bytes) -> bytes:
+    """
+    keccak256_blake2b_hash hashes the given bytes with BLAKE2b and then hashes the result with KECCAK256.
+    It is the hash used in the checksums of addresses, contract IDs & token IDs.
+
+    Args:
+        b (bytes): bytes to hash
+
+    Returns:
+        bytes: The hash result
+    """
+    # Inlined as it is on the hot path of address validation.
+    return keccak256(_blake2b(b, digest_size=32).digest())
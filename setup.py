@@ -33,5 +33,9 @@ setuptools.setup(
         "base58~=2.1.1",
         "loguru~=0.7.2",
     ],
+    extras_require={
+        "nacl": ["pynacl~=1.5.0"],
+        "based58": ["based58~=0.1.1"],
+    },
     python_requires=">=3.8",
 )
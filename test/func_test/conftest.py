@@ -1,8 +1,12 @@
 import asyncio
+import itertools
 import os
-from typing import Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional
 
+import aiohttp
 import pytest
+import pytest_asyncio
 
 import py_vsys as pv
 
@@ -11,41 +15,80 @@ API_KEY = os.getenv("PY_SDK_API_KEY", "")
 SEED = os.getenv("PY_SDK_SEED")
 SUPERNODE_ADDR = os.getenv("PY_SDK_SUPERNODE_ADDR")
 AVG_BLOCK_DELAY = int(os.getenv("PY_SDK_AVG_BLOCK_DELAY", "6"))  # in seconds
+TX_POLL_MAX_INTERVAL = min(0.5, AVG_BLOCK_DELAY / 2)  # in seconds
+# Whether to also assert the state that a test expects before its action,
+# which the fixtures have already asserted when setting it up.
+CHECK_INVARIANTS = os.getenv("VSYS_TEST_FULL_INVARIANTS", "") not in ("", "0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def host() -> str:
     return HOST
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_key() -> Optional[str]:
     return API_KEY or None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """
+    event_loop is the fixture that overrides the function-scoped event loop of
+    pytest-asyncio so that the session-scoped fixtures can live across the tests.
+    Newer pytest-asyncio releases deprecate & then ignore it,
+    taking the loop scopes set in pytest.ini instead.
+
+    Yields:
+        asyncio.AbstractEventLoop: The event loop.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def api(host: str, api_key: str) -> pv.NodeAPI:
-    a = await pv.NodeAPI.new(host, api_key)
+    """
+    api is the fixture that returns the NodeAPI object whose HTTP session
+    (and so its kept-alive connections) is shared by all the tests.
+
+    Args:
+        host (str): The node host.
+        api_key (str): The node API key.
+
+    Returns:
+        pv.NodeAPI: The NodeAPI object.
+    """
+    # Size the pool for the concurrent fan-outs in the tests & keep idle connections
+    # around between them. aiohttp already sets TCP_NODELAY on its sockets.
+    connector = aiohttp.TCPConnector(
+        limit=256,
+        limit_per_host=64,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    a = await pv.NodeAPI.new(host, api_key, connector=connector)
     yield a
     await a.sess.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chain(api: pv.NodeAPI) -> pv.Chain:
     return pv.Chain(api, pv.ChainID.TEST_NET)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def seed() -> pv.Seed:
     return pv.Seed(SEED)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wallet(seed: pv.Seed) -> pv.Wallet:
     return pv.Wallet(seed)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def acnt0(chain: pv.Chain, wallet: pv.Wallet) -> pv.Account:
     """
     acnt0 is the fixture that returns the account of nonce 0.
@@ -60,7 +103,7 @@ def acnt0(chain: pv.Chain, wallet: pv.Wallet) -> pv.Account:
     return wallet.get_account(chain, 0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def acnt1(chain: pv.Chain, wallet: pv.Wallet) -> pv.Account:
     """
     acnt1 is the fixture that returns the account of nonce 1.
@@ -75,7 +118,7 @@ def acnt1(chain: pv.Chain, wallet: pv.Wallet) -> pv.Account:
     return wallet.get_account(chain, 1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def acnt2(chain: pv.Chain, wallet: pv.Wallet) -> pv.Account:
     """
     acnt2 is the fixture that returns the account of nonce 2.
@@ -97,6 +140,108 @@ async def wait_for_block() -> None:
     await asyncio.sleep(AVG_BLOCK_DELAY)
 
 
+async def _poll(
+    fetch: Callable[[], Awaitable[Dict[str, Any]]],
+    is_done: Callable[[Dict[str, Any]], bool],
+    timeout: float,
+    err_msg: str,
+) -> Dict[str, Any]:
+    """
+    _poll calls fetch until is_done holds for its response.
+    The polling interval backs off exponentially from 50 ms to TX_POLL_MAX_INTERVAL.
+
+    Args:
+        fetch (Callable[[], Awaitable[Dict[str, Any]]]): The call that fetches the response.
+        is_done (Callable[[Dict[str, Any]], bool]): The check that tells if the response is the final one.
+        timeout (float): The max time to wait in seconds.
+        err_msg (str): The message of the error raised on timeout.
+
+    Returns:
+        Dict[str, Any]: The final response.
+    """
+    deadline = time.monotonic() + timeout
+    delays = itertools.chain(
+        (0.05, 0.1, 0.2, 0.4), itertools.repeat(TX_POLL_MAX_INTERVAL)
+    )
+
+    for delay in delays:
+        resp = await fetch()
+        # The node answers with an error body until the data is on chain.
+        if is_done(resp):
+            return resp
+        if time.monotonic() >= deadline:
+            raise asyncio.TimeoutError(err_msg)
+        await asyncio.sleep(delay)
+
+
+async def wait_for_tx(api: pv.NodeAPI, tx_id: str, timeout: float = 60) -> None:
+    """
+    wait_for_tx polls the node until the transaction of the given ID is packed
+    into a block & asserts its status is success.
+
+    Args:
+        api (pv.NodeAPI): The NodeAPI object.
+        tx_id (str): The transaction ID.
+        timeout (float, optional): The max time to wait in seconds. Defaults to 60.
+    """
+    get_info = api.tx.get_info
+
+    resp = await _poll(
+        lambda: get_info(tx_id),
+        lambda resp: resp.get("id") == tx_id,
+        timeout,
+        f"Transaction {tx_id} is not packed in {timeout}s",
+    )
+    assert resp["status"] == "Success"
+
+
+async def wait_for_ctrt(api: pv.NodeAPI, ctrt_id: str, timeout: float = 60) -> None:
+    """
+    wait_for_ctrt polls the node until the contract of the given ID is registered.
+
+    Args:
+        api (pv.NodeAPI): The NodeAPI object.
+        ctrt_id (str): The contract ID.
+        timeout (float, optional): The max time to wait in seconds. Defaults to 60.
+    """
+    get_ctrt_info = api.ctrt.get_ctrt_info
+
+    await _poll(
+        lambda: get_ctrt_info(ctrt_id),
+        lambda resp: resp.get("contractId") == ctrt_id,
+        timeout,
+        f"Contract {ctrt_id} is not registered in {timeout}s",
+    )
+
+
+async def gather_bounded(*aws: Awaitable, limit: int = 8) -> List[Any]:
+    """
+    gather_bounded works like asyncio.gather but runs at most `limit` of the given
+    awaitables at a time so as to bound the number of concurrent requests to the node.
+    If any of them fails, the rest are cancelled & the error is raised at once.
+
+    Args:
+        *aws (Awaitable): The awaitables to run.
+        limit (int, optional): The max number of awaitables to run at a time. Defaults to 8.
+
+    Returns:
+        List[Any]: The results in the same order as the given awaitables.
+    """
+    sem = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable) -> Any:
+        async with sem:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        raise
+
+
 async def assert_tx_status(api: pv.NodeAPI, tx_id: str, status: str) -> None:
     """
     assert_tx_status asserts the status of the transaction of the given
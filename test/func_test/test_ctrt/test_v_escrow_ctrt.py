@@ -1,13 +1,197 @@
 import asyncio
 import time
-from typing import Tuple
+from typing import Awaitable, Callable, Optional, Tuple
 
 import pytest
+import pytest_asyncio
 
 import py_vsys as pv
 from test.func_test import conftest as cft
 
 
+async def _new_ctrt(
+    new_tok_ctrt: pv.TokCtrtWithoutSplit,
+    maker: pv.Account,
+    judge: pv.Account,
+    payer: pv.Account,
+    recipient: pv.Account,
+    duration: int,
+    deposit_amount: int,
+) -> pv.VEscrowCtrt:
+    """
+    _new_ctrt registers a new V Escrow Contract where the payer duration & judge duration
+    are all the given duration & every party deposits the given amount into it.
+
+    Args:
+        new_tok_ctrt (pv.TokCtrtWithoutSplit): The token contract instance.
+        maker (pv.Account): The account of the contract maker.
+        judge (pv.Account): The account of the contract judge.
+        payer (pv.Account): The account of the contract payer.
+        recipient (pv.Account): The account of the contract recipient.
+        duration (int): The duration in seconds.
+        deposit_amount (int): The amount each party deposits into the contract.
+
+    Returns:
+        pv.VEscrowCtrt: The VEscrowCtrt instance.
+    """
+    tc = new_tok_ctrt
+    api = maker.api
+
+    vc = await pv.VEscrowCtrt.register(
+        by=maker,
+        tok_id=tc.tok_id.data,
+        duration=duration,
+        judge_duration=duration,
+    )
+    await cft.wait_for_ctrt(api, vc.ctrt_id.data)
+
+    judge_resp, payer_resp, rcpt_resp = await cft.gather_bounded(
+        tc.deposit(judge, vc.ctrt_id.data, deposit_amount),
+        tc.deposit(payer, vc.ctrt_id.data, deposit_amount),
+        tc.deposit(recipient, vc.ctrt_id.data, deposit_amount),
+    )
+    await cft.gather_bounded(
+        cft.wait_for_tx(api, judge_resp["id"]),
+        cft.wait_for_tx(api, payer_resp["id"]),
+        cft.wait_for_tx(api, rcpt_resp["id"]),
+    )
+    return vc
+
+
+@pytest.fixture(scope="class")
+def maker(acnt0: pv.Account) -> pv.Account:
+    """
+    maker is the fixture that returns the maker account used in the tests.
+
+    Args:
+        acnt0 (pv.Account): The account of nonce 0.
+
+    Returns:
+        pv.Account: The account.
+    """
+    return acnt0
+
+
+@pytest.fixture(scope="class")
+def judge(acnt0: pv.Account) -> pv.Account:
+    """
+    judge is the fixture that returns the judge account used in the tests.
+
+    Args:
+        acnt0 (pv.Account): The account of nonce 0.
+
+    Returns:
+        pv.Account: The account.
+    """
+    return acnt0
+
+
+@pytest.fixture(scope="class")
+def payer(acnt1: pv.Account) -> pv.Account:
+    """
+    payer is the fixture that returns the payer account used in the tests.
+
+    Args:
+        acnt0 (pv.Account): The account of nonce 0.
+
+    Returns:
+        pv.Account: The account.
+    """
+    return acnt1
+
+
+@pytest.fixture(scope="class")
+def recipient(acnt2: pv.Account) -> pv.Account:
+    """
+    recipient is the fixture that returns the recipient account used in the tests.
+
+    Args:
+        acnt0 (pv.Account): The account of nonce 0.
+
+    Returns:
+        pv.Account: The account.
+    """
+    return acnt2
+
+
+@pytest_asyncio.fixture(scope="class")
+async def new_tok_ctrt(
+    acnt0: pv.Account,
+    acnt1: pv.Account,
+    acnt2: pv.Account,
+) -> pv.TokCtrtWithoutSplit:
+    """
+    new_tok_ctrt is the fixture that returns a token contract instance.
+
+    Args:
+        acnt0 (pv.Account): The account of nonce 0.
+        acnt1 (pv.Account): The account of nonce 1.
+        acnt2 (pv.Account): The account of nonce 2.
+
+    Returns:
+        pv.TokCtrtWithoutSplit: The token contract instance.
+    """
+    api = acnt0.api
+
+    tc = await pv.TokCtrtWithoutSplit.register(
+        by=acnt0,
+        max=TestVEscrowCtrt.TOK_TOTAL,
+        unit=TestVEscrowCtrt.TOK_UNIT,
+    )
+    await cft.wait_for_ctrt(api, tc.ctrt_id.data)
+
+    resp = await tc.issue(
+        by=acnt0,
+        amount=TestVEscrowCtrt.TOK_TOTAL,
+    )
+    await cft.wait_for_tx(api, resp["id"])
+
+    acnt1_resp, acnt2_resp = await asyncio.gather(
+        tc.send(by=acnt0, recipient=acnt1.addr.data, amount=TestVEscrowCtrt.TOK_EACH),
+        tc.send(by=acnt0, recipient=acnt2.addr.data, amount=TestVEscrowCtrt.TOK_EACH),
+    )
+    await asyncio.gather(
+        cft.wait_for_tx(api, acnt1_resp["id"]),
+        cft.wait_for_tx(api, acnt2_resp["id"]),
+    )
+
+    return tc
+
+
+@pytest_asyncio.fixture(scope="class")
+async def shared_ctrt(
+    new_tok_ctrt: pv.TokCtrtWithoutSplit,
+    maker: pv.Account,
+    judge: pv.Account,
+    payer: pv.Account,
+    recipient: pv.Account,
+) -> pv.VEscrowCtrt:
+    """
+    shared_ctrt is the fixture that registers a V Escrow Contract once for the class.
+    Tests that only work on their own orders share it.
+    Tests that change the contract itself (e.g. supersede) use new_ctrt instead.
+
+    Args:
+        new_tok_ctrt (pv.TokCtrtWithoutSplit): The token contract instance.
+        maker (pv.Account): The account of the contract maker.
+        judge (pv.Account): The account of the contract judge.
+        payer (pv.Account): The account of the contract payer.
+        recipient (pv.Account): The account of the contract recipient.
+
+    Returns:
+        pv.VEscrowCtrt: The VEscrowCtrt instance.
+    """
+    return await _new_ctrt(
+        new_tok_ctrt,
+        maker,
+        judge,
+        payer,
+        recipient,
+        TestVEscrowCtrt.DURATION,
+        TestVEscrowCtrt.SHARED_CTRT_DEPOSIT_AMOUNT,
+    )
+
+
 class TestVEscrowCtrt:
     """
     TestVEscrowCtrt is the collection of functional tests of V Escrow Contract.
@@ -22,58 +206,19 @@ class TestVEscrowCtrt:
     JUDGE_DEPOSIT_AMOUNT = 3
     ORDER_FEE = 4
     REFUND_AMOUNT = 5
+    TOTAL_IN_ORDER = ORDER_AMOUNT + RCPT_DEPOSIT_AMOUNT + JUDGE_DEPOSIT_AMOUNT
+    RCPT_AMOUNT = ORDER_AMOUNT - ORDER_FEE
+    RCPT_REFUND_AMOUNT = TOTAL_IN_ORDER - REFUND_AMOUNT
+    # The judge divides the payer & recipient deposits net of the fee.
+    JUDGE_TO_PAYER = 3
+    JUDGE_TO_RCPT = ORDER_AMOUNT + RCPT_DEPOSIT_AMOUNT - ORDER_FEE - JUDGE_TO_PAYER
     CTRT_DEPOSIT_AMOUNT = 50
+    # Enough for every order created on the shared contract in the class.
+    SHARED_CTRT_DEPOSIT_AMOUNT = 500
     ORDER_PERIOD = 45  # in seconds
     DURATION = cft.AVG_BLOCK_DELAY * 2
-
-    async def _new_ctrt(
-        self,
-        new_tok_ctrt: pv.TokCtrtWithoutSplit,
-        maker: pv.Account,
-        judge: pv.Account,
-        payer: pv.Account,
-        recipient: pv.Account,
-        duration: int,
-    ) -> pv.VEscrowCtrt:
-        """
-        _new_ctrt registers a new V Escrow Contract where the payer duration & judge duration
-        are all the given duration.
-
-        Args:
-            new_tok_ctrt (pv.TokCtrtWithoutSplit): The token contract instance.
-            maker (pv.Account): The account of the contract maker.
-            judge (pv.Account): The account of the contract judge.
-            payer (pv.Account): The account of the contract payer.
-            recipient (pv.Account): The account of the contract recipient.
-            duration (int): The duration in seconds.
-
-        Returns:
-            pv.VEscrowCtrt: The VEscrowCtrt instance.
-        """
-        tc = new_tok_ctrt
-        api = maker.api
-
-        vc = await pv.VEscrowCtrt.register(
-            by=maker,
-            tok_id=tc.tok_id.data,
-            duration=duration,
-            judge_duration=duration,
-        )
-        await cft.wait_for_block()
-
-        judge_resp, payer_resp, rcpt_resp = await asyncio.gather(
-            tc.deposit(judge, vc.ctrt_id.data, self.CTRT_DEPOSIT_AMOUNT),
-            tc.deposit(payer, vc.ctrt_id.data, self.CTRT_DEPOSIT_AMOUNT),
-            tc.deposit(recipient, vc.ctrt_id.data, self.CTRT_DEPOSIT_AMOUNT),
-        )
-        await cft.wait_for_block()
-
-        await asyncio.gather(
-            cft.assert_tx_success(api, judge_resp["id"]),
-            cft.assert_tx_success(api, payer_resp["id"]),
-            cft.assert_tx_success(api, rcpt_resp["id"]),
-        )
-        return vc
+    # The stages an order fixture can be driven to, in order.
+    ORDER_STAGES = ("created", "deposited", "work_submitted")
 
     async def _create_order(
         self,
@@ -106,8 +251,7 @@ class TestVEscrowCtrt:
             refund_amount=self.REFUND_AMOUNT,
             expire_at=expire_at,
         )
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
         order_id = resp["id"]
 
         return vc, order_id
@@ -135,24 +279,23 @@ class TestVEscrowCtrt:
 
         # payer has deposited when creating the order
         # Let recipient & judge deposit
-        rcpt_resp, judge_resp = await asyncio.gather(
+        rcpt_resp, judge_resp = await cft.gather_bounded(
             vc.recipient_deposit(recipient, order_id),
             vc.judge_deposit(judge, order_id),
         )
-        await cft.wait_for_block()
-
-        await asyncio.gather(
-            cft.assert_tx_success(api, rcpt_resp["id"]),
-            cft.assert_tx_success(api, judge_resp["id"]),
-        )
-
-        rcpt_status, judge_status = await asyncio.gather(
-            vc.get_order_recipient_deposit_status(order_id),
-            vc.get_order_judge_deposit_status(order_id),
+        await cft.gather_bounded(
+            cft.wait_for_tx(api, rcpt_resp["id"]),
+            cft.wait_for_tx(api, judge_resp["id"]),
         )
 
-        assert rcpt_status is True
-        assert judge_status is True
+        # wait_for_tx has asserted both deposits succeeded.
+        if cft.CHECK_INVARIANTS:
+            rcpt_status, judge_status = await asyncio.gather(
+                vc.get_order_recipient_deposit_status(order_id),
+                vc.get_order_judge_deposit_status(order_id),
+            )
+            assert rcpt_status is True
+            assert judge_status is True
 
         return vc, order_id
 
@@ -176,111 +319,11 @@ class TestVEscrowCtrt:
         api = recipient.api
 
         resp = await vc.submit_work(recipient, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         return vc, order_id
 
-    @pytest.fixture
-    def maker(self, acnt0: pv.Account) -> pv.Account:
-        """
-        maker is the fixture that returns the maker account used in the tests.
-
-        Args:
-            acnt0 (pv.Account): The account of nonce 0.
-
-        Returns:
-            pv.Account: The account.
-        """
-        return acnt0
-
-    @pytest.fixture
-    def judge(self, acnt0: pv.Account) -> pv.Account:
-        """
-        judge is the fixture that returns the judge account used in the tests.
-
-        Args:
-            acnt0 (pv.Account): The account of nonce 0.
-
-        Returns:
-            pv.Account: The account.
-        """
-        return acnt0
-
-    @pytest.fixture
-    def payer(self, acnt1: pv.Account) -> pv.Account:
-        """
-        payer is the fixture that returns the payer account used in the tests.
-
-        Args:
-            acnt0 (pv.Account): The account of nonce 0.
-
-        Returns:
-            pv.Account: The account.
-        """
-        return acnt1
-
-    @pytest.fixture
-    def recipient(self, acnt2: pv.Account) -> pv.Account:
-        """
-        recipient is the fixture that returns the recipient account used in the tests.
-
-        Args:
-            acnt0 (pv.Account): The account of nonce 0.
-
-        Returns:
-            pv.Account: The account.
-        """
-        return acnt2
-
-    @pytest.fixture
-    async def new_tok_ctrt(
-        self,
-        acnt0: pv.Account,
-        acnt1: pv.Account,
-        acnt2: pv.Account,
-    ) -> pv.TokCtrtWithoutSplit:
-        """
-        new_tok_ctrt is the fixture that returns a token contract instance.
-
-        Args:
-            acnt0 (pv.Account): The account of nonce 0.
-            acnt1 (pv.Account): The account of nonce 1.
-            acnt2 (pv.Account): The account of nonce 2.
-
-        Returns:
-            pv.TokCtrtWithoutSplit: The token contract instance.
-        """
-        api = acnt0.api
-
-        tc = await pv.TokCtrtWithoutSplit.register(
-            by=acnt0,
-            max=self.TOK_TOTAL,
-            unit=self.TOK_UNIT,
-        )
-        await cft.wait_for_block()
-
-        resp = await tc.issue(
-            by=acnt0,
-            amount=self.TOK_TOTAL,
-        )
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
-
-        acnt1_resp, acnt2_resp = await asyncio.gather(
-            tc.send(by=acnt0, recipient=acnt1.addr.data, amount=self.TOK_EACH),
-            tc.send(by=acnt0, recipient=acnt2.addr.data, amount=self.TOK_EACH),
-        )
-        await cft.wait_for_block()
-
-        await asyncio.gather(
-            cft.assert_tx_success(api, acnt1_resp["id"]),
-            cft.assert_tx_success(api, acnt2_resp["id"]),
-        )
-
-        return tc
-
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def new_ctrt(
         self,
         new_tok_ctrt: pv.TokCtrtWithoutSplit,
@@ -303,118 +346,138 @@ class TestVEscrowCtrt:
         Returns:
             pv.VEscrowCtrt: The VEscrowCtrt instance.
         """
-        return await self._new_ctrt(
+        return await _new_ctrt(
             new_tok_ctrt,
             maker,
             judge,
             payer,
             recipient,
             self.DURATION,
+            self.CTRT_DEPOSIT_AMOUNT,
         )
 
     @pytest.fixture
-    async def new_ctrt_order(
+    def new_order_factory(
         self,
-        new_ctrt: pv.VEscrowCtrt,
+        shared_ctrt: pv.VEscrowCtrt,
         payer: pv.Account,
         recipient: pv.Account,
-    ) -> Tuple[pv.VEscrowCtrt, str]:
+        judge: pv.Account,
+    ) -> Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]]:
         """
-        new_ctrt_order is the fixture that registers
-        a new V Escrow Contract where
-        - an order is created.
+        new_order_factory is the fixture that returns a coroutine function which
+        creates an order on the shared V Escrow Contract & drives it up to the given stage
+        in one go, so the order fixtures below are thin wrappers over it.
+
+        Each stage is confirmed before the next one is sent as the node checks
+        every tx against the state on chain.
 
         Args:
-            new_ctrt (pv.VEscrowCtrt): The V Escrow contract instance.
+            shared_ctrt (pv.VEscrowCtrt): The V Escrow contract instance.
             payer (pv.Account): The account of the contract payer.
             recipient (pv.Account): The account of the contract recipient.
+            judge (pv.Account): The account of the contract judge.
+
+        Returns:
+            Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]]: The factory that takes
+            the stage (one of ORDER_STAGES) & optionally the expiration timestamp.
+        """
+
+        async def new_order(
+            stage: str, expire_at: Optional[int] = None
+        ) -> Tuple[pv.VEscrowCtrt, str]:
+            goal = self.ORDER_STAGES.index(stage)
+            if expire_at is None:
+                expire_at = int(time.time()) + self.ORDER_PERIOD
+
+            vc, order_id = await self._create_order(
+                shared_ctrt, payer, recipient, expire_at
+            )
+            if goal >= self.ORDER_STAGES.index("deposited"):
+                await self._deposit_to_order(vc, order_id, recipient, judge)
+            if goal >= self.ORDER_STAGES.index("work_submitted"):
+                await self._submit_work(vc, order_id, recipient)
+            return vc, order_id
+
+        return new_order
+
+    @pytest_asyncio.fixture
+    async def new_ctrt_order(
+        self,
+        new_order_factory: Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]],
+    ) -> Tuple[pv.VEscrowCtrt, str]:
+        """
+        new_ctrt_order is the fixture that creates
+        a new order on the shared V Escrow Contract.
+
+        Args:
+            new_order_factory (Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]]): The order factory.
 
         Returns:
             Tuple[pv.VEscrowCtrt, str]: The VEscrowCtrt instance and the order_id
         """
-        vc = new_ctrt
-        expire_at = int(time.time()) + self.ORDER_PERIOD
-        return await self._create_order(vc, payer, recipient, expire_at)
+        return await new_order_factory("created")
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def new_ctrt_order_deposited(
         self,
-        new_ctrt_order: Tuple[pv.VEscrowCtrt, str],
-        recipient: pv.Account,
-        judge: pv.Account,
+        new_order_factory: Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]],
     ) -> Tuple[pv.VEscrowCtrt, str]:
         """
-        new_ctrt_order_deposited is the fixture that registers
-        a new V Escrow Contract where
-        - an order is created.
+        new_ctrt_order_deposited is the fixture that creates
+        an order on the shared V Escrow Contract where
         - payer, recipient, & judge have all deposited into it.
 
         Args:
-            new_ctrt_order (Tuple[pv.VEscrowCtrt, str]): The V Escrow contract instance.
-            recipient (pv.Account): The account of the contract recipient.
-            judge (pv.Account): The account of the contract judge.
+            new_order_factory (Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]]): The order factory.
 
         Returns:
             Tuple[pv.VEscrowCtrt, str]: The VEscrowCtrt instance and the order_id
         """
-        vc, order_id = new_ctrt_order
-        return await self._deposit_to_order(vc, order_id, recipient, judge)
+        return await new_order_factory("deposited")
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def new_ctrt_quick_expire_order_deposited(
         self,
-        new_ctrt: pv.VEscrowCtrt,
-        payer: pv.Account,
-        recipient: pv.Account,
-        judge: pv.Account,
+        new_order_factory: Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]],
     ) -> Tuple[pv.VEscrowCtrt, str]:
         """
-        new_ctrt_quick_expire_order_deposited is the fixture that registers
-        a new V Escrow Contract where
-        - the payer duration & judge duration are all ten mins
-        - an order that is expiring SOON is created
+        new_ctrt_quick_expire_order_deposited is the fixture that creates
+        an order that is expiring SOON on the shared V Escrow Contract
+        & lets every party deposit into it.
 
         Args:
-            new_ctrt (pv.VEscrowCtrt): The V Escrow contract instance.
-            payer (pv.Account): The account of the contract payer.
-            recipient (pv.Account): The account of the contract recipient.
-            judge (pv.Account): The account of the contract judge.
+            new_order_factory (Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]]): The order factory.
 
         Returns:
             Tuple[pv.VEscrowCtrt, str]: The VEscrowCtrt instance and the order_id
         """
-        vc = new_ctrt
         five_secs_later = int(time.time()) + 5
-        vc, order_id = await self._create_order(vc, payer, recipient, five_secs_later)
-        return await self._deposit_to_order(vc, order_id, recipient, judge)
+        return await new_order_factory("deposited", five_secs_later)
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def new_ctrt_work_submitted(
         self,
-        new_ctrt_order_deposited: Tuple[pv.VEscrowCtrt, str],
-        recipient: pv.Account,
+        new_order_factory: Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]],
     ) -> Tuple[pv.VEscrowCtrt, str]:
         """
-        new_ctrt_work_submitted is the fixture that registers
-        a new V Escrow Contract where
-        - an order is created.
+        new_ctrt_work_submitted is the fixture that creates
+        an order on the shared V Escrow Contract where
         - payer, recipient, & judge have all deposited into it.
         - recipient has submitted the work.
 
         Args:
-            new_ctrt_order_deposited (Tuple[pv.VEscrowCtrt, str]): The V Escrow contract instance.
-            recipient (pv.Account): The account of the contract recipient.
+            new_order_factory (Callable[..., Awaitable[Tuple[pv.VEscrowCtrt, str]]]): The order factory.
 
         Returns:
             Tuple[pv.VEscrowCtrt, str]: The VEscrowCtrt instance and the order_id
         """
-        vc, order_id = new_ctrt_order_deposited
-        return await self._submit_work(vc, order_id, recipient)
+        return await new_order_factory("work_submitted")
 
     async def test_register(
         self,
         new_tok_ctrt: pv.TokCtrtWithoutSplit,
-        new_ctrt: pv.VEscrowCtrt,
+        shared_ctrt: pv.VEscrowCtrt,
         maker: pv.Account,
     ) -> pv.VEscrowCtrt:
         """
@@ -422,7 +485,7 @@ class TestVEscrowCtrt:
 
         Args:
             new_tok_ctrt (pv.TokCtrtWithoutSplit): The token contract instance.
-            new_ctrt (pv.VEscrowCtrt): The V Escrow contract instance.
+            shared_ctrt (pv.VEscrowCtrt): The V Escrow contract instance.
             maker (pv.Account): The account of the contract maker.
 
         Returns:
@@ -430,7 +493,7 @@ class TestVEscrowCtrt:
         """
 
         tc = new_tok_ctrt
-        vc = new_ctrt
+        vc = shared_ctrt
 
         assert (await vc.maker) == maker.addr
         assert (await vc.judge) == maker.addr
@@ -470,15 +533,14 @@ class TestVEscrowCtrt:
         assert judge == acnt0.addr
 
         resp = await vc.supersede(acnt0, acnt1.addr.data)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         judge = await vc.judge
         assert judge == acnt1.addr
 
     async def test_create(
         self,
-        new_ctrt: pv.VEscrowCtrt,
+        shared_ctrt: pv.VEscrowCtrt,
         payer: pv.Account,
         recipient: pv.Account,
         judge: pv.Account,
@@ -487,7 +549,7 @@ class TestVEscrowCtrt:
         test_create tests the method create.
 
         Args:
-            new_ctrt (pv.VEscrowCtrt): The V Escrow contract instance.
+            shared_ctrt (pv.VEscrowCtrt): The V Escrow contract instance.
             payer (pv.Account): The account of the contract payer.
             recipient (pv.Account): The account of the contract recipient.
             judge (pv.Account): The account of the contract judge.
@@ -496,7 +558,7 @@ class TestVEscrowCtrt:
             Tuple[pv.VEscrowCtrt, str]: The VEscrowCtrt instance and the order_id
         """
 
-        vc = new_ctrt
+        vc = shared_ctrt
         api = judge.api
         later = int(time.time()) + self.ORDER_PERIOD
 
@@ -510,40 +572,66 @@ class TestVEscrowCtrt:
             refund_amount=self.REFUND_AMOUNT,
             expire_at=later,
         )
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         order_id = resp["id"]
 
-        assert (await vc.get_order_payer(order_id)) == payer.addr
-        assert (await vc.get_order_recipient(order_id)) == recipient.addr
-        assert (await vc.get_order_amount(order_id)).amount == self.ORDER_AMOUNT
-        assert (
-            await vc.get_order_recipient_deposit(order_id)
-        ).amount == self.RCPT_DEPOSIT_AMOUNT
-        assert (
-            await vc.get_order_judge_deposit(order_id)
-        ).amount == self.JUDGE_DEPOSIT_AMOUNT
-        assert (await vc.get_order_fee(order_id)).amount == self.ORDER_FEE
-        assert (
-            await vc.get_order_recipient_amount(order_id)
-        ).amount == self.ORDER_AMOUNT - self.ORDER_FEE
-        assert (await vc.get_order_refund(order_id)).amount == self.REFUND_AMOUNT
-
-        total_in_order = (
-            self.ORDER_AMOUNT + self.RCPT_DEPOSIT_AMOUNT + self.JUDGE_DEPOSIT_AMOUNT
+        (
+            payer_addr,
+            rcpt_addr,
+            amount,
+            rcpt_dep,
+            judge_dep,
+            fee,
+            rcpt_amt,
+            refund,
+            rcpt_refund,
+            expire_at,
+            status,
+            rcpt_dep_status,
+            judge_dep_status,
+            submit_status,
+            judge_status,
+            rcpt_locked,
+            judge_locked,
+        ) = await asyncio.gather(
+            vc.get_order_payer(order_id),
+            vc.get_order_recipient(order_id),
+            vc.get_order_amount(order_id),
+            vc.get_order_recipient_deposit(order_id),
+            vc.get_order_judge_deposit(order_id),
+            vc.get_order_fee(order_id),
+            vc.get_order_recipient_amount(order_id),
+            vc.get_order_refund(order_id),
+            vc.get_order_recipient_refund(order_id),
+            vc.get_order_expiration_time(order_id),
+            vc.get_order_status(order_id),
+            vc.get_order_recipient_deposit_status(order_id),
+            vc.get_order_judge_deposit_status(order_id),
+            vc.get_order_submit_status(order_id),
+            vc.get_order_judge_status(order_id),
+            vc.get_order_recipient_locked_amount(order_id),
+            vc.get_order_judge_locked_amount(order_id),
         )
-        assert (
-            await vc.get_order_recipient_refund(order_id)
-        ).amount == total_in_order - self.REFUND_AMOUNT
-        assert (await vc.get_order_expiration_time(order_id)).unix_ts == later
-        assert (await vc.get_order_status(order_id)) is True
-        assert (await vc.get_order_recipient_deposit_status(order_id)) is False
-        assert (await vc.get_order_judge_deposit_status(order_id)) is False
-        assert (await vc.get_order_submit_status(order_id)) is False
-        assert (await vc.get_order_judge_status(order_id)) is False
-        assert (await vc.get_order_recipient_locked_amount(order_id)).amount == 0
-        assert (await vc.get_order_judge_locked_amount(order_id)).amount == 0
+
+        assert payer_addr == payer.addr
+        assert rcpt_addr == recipient.addr
+        assert amount.amount == self.ORDER_AMOUNT
+        assert rcpt_dep.amount == self.RCPT_DEPOSIT_AMOUNT
+        assert judge_dep.amount == self.JUDGE_DEPOSIT_AMOUNT
+        assert fee.amount == self.ORDER_FEE
+        assert rcpt_amt.amount == self.RCPT_AMOUNT
+        assert refund.amount == self.REFUND_AMOUNT
+
+        assert rcpt_refund.amount == self.RCPT_REFUND_AMOUNT
+        assert expire_at.unix_ts == later
+        assert status is True
+        assert rcpt_dep_status is False
+        assert judge_dep_status is False
+        assert submit_status is False
+        assert judge_status is False
+        assert rcpt_locked.amount == 0
+        assert judge_locked.amount == 0
 
         return vc, order_id
 
@@ -562,17 +650,22 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_order
         api = recipient.api
 
-        assert (await vc.get_order_recipient_deposit_status(order_id)) is False
-        assert (await vc.get_order_recipient_locked_amount(order_id)).amount == 0
+        dep_status, locked = await asyncio.gather(
+            vc.get_order_recipient_deposit_status(order_id),
+            vc.get_order_recipient_locked_amount(order_id),
+        )
+        assert dep_status is False
+        assert locked.amount == 0
 
         resp = await vc.recipient_deposit(recipient, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
-        assert (await vc.get_order_recipient_deposit_status(order_id)) is True
-        assert (
-            await vc.get_order_recipient_locked_amount(order_id)
-        ).amount == self.RCPT_DEPOSIT_AMOUNT
+        dep_status, locked = await asyncio.gather(
+            vc.get_order_recipient_deposit_status(order_id),
+            vc.get_order_recipient_locked_amount(order_id),
+        )
+        assert dep_status is True
+        assert locked.amount == self.RCPT_DEPOSIT_AMOUNT
 
     async def test_judge_deposit(
         self,
@@ -589,17 +682,22 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_order
         api = judge.api
 
-        assert (await vc.get_order_judge_deposit_status(order_id)) is False
-        assert (await vc.get_order_judge_locked_amount(order_id)).amount == 0
+        dep_status, locked = await asyncio.gather(
+            vc.get_order_judge_deposit_status(order_id),
+            vc.get_order_judge_locked_amount(order_id),
+        )
+        assert dep_status is False
+        assert locked.amount == 0
 
         resp = await vc.judge_deposit(judge, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
-        assert (await vc.get_order_judge_deposit_status(order_id)) is True
-        assert (
-            await vc.get_order_judge_locked_amount(order_id)
-        ).amount == self.JUDGE_DEPOSIT_AMOUNT
+        dep_status, locked = await asyncio.gather(
+            vc.get_order_judge_deposit_status(order_id),
+            vc.get_order_judge_locked_amount(order_id),
+        )
+        assert dep_status is True
+        assert locked.amount == self.JUDGE_DEPOSIT_AMOUNT
 
     async def test_payer_cancel(
         self,
@@ -617,11 +715,11 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_order
         api = payer.api
 
-        assert (await vc.get_order_status(order_id)) is True
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
         resp = await vc.payer_cancel(payer, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
@@ -641,11 +739,11 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_order
         api = recipient.api
 
-        assert (await vc.get_order_status(order_id)) is True
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
         resp = await vc.recipient_cancel(recipient, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
@@ -665,11 +763,11 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_order
         api = judge.api
 
-        assert (await vc.get_order_status(order_id)) is True
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
         resp = await vc.judge_cancel(judge, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
@@ -689,11 +787,11 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_order_deposited
         api = recipient.api
 
-        assert (await vc.get_order_submit_status(order_id)) is False
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_submit_status(order_id)) is False
 
         resp = await vc.submit_work(recipient, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_submit_status(order_id)) is True
 
@@ -716,19 +814,29 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_work_submitted
         api = payer.api
 
-        rcpt_bal_old, judge_bal_old = await asyncio.gather(
-            vc.get_ctrt_bal(recipient.addr.data), vc.get_ctrt_bal(judge.addr.data)
-        )
-
-        assert (await vc.get_order_status(order_id)) is True
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
-        resp = await vc.approve_work(payer, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        # The tx applies only once packed, so read the old state meanwhile.
+        (rcpt_bal_old, judge_bal_old), resp = await cft.gather_bounded(
+            cft.gather_bounded(
+                vc.get_ctrt_bal(recipient.addr.data),
+                vc.get_ctrt_bal(judge.addr.data),
+            ),
+            vc.approve_work(payer, order_id),
+        )
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
-        rcpt_amt, fee, rcpt_dep, judge_dep, rcpt_bal, judge_bal = await asyncio.gather(
+        (
+            rcpt_amt,
+            fee,
+            rcpt_dep,
+            judge_dep,
+            rcpt_bal,
+            judge_bal,
+        ) = await cft.gather_bounded(
             vc.get_order_recipient_amount(order_id),
             vc.get_order_fee(order_id),
             vc.get_order_recipient_deposit(order_id),
@@ -763,36 +871,43 @@ class TestVEscrowCtrt:
         vc, order_id = new_ctrt_work_submitted
         api = payer.api
 
-        payer_bal_old, rcpt_bal_old, judge_bal_old = await asyncio.gather(
-            vc.get_ctrt_bal(payer.addr.data),
-            vc.get_ctrt_bal(recipient.addr.data),
-            vc.get_ctrt_bal(judge.addr.data),
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
+
+        # The tx applies only once packed, so read the old state meanwhile.
+        (
+            (payer_bal_old, rcpt_bal_old, judge_bal_old),
+            resp,
+        ) = await cft.gather_bounded(
+            cft.gather_bounded(
+                vc.get_ctrt_bal(payer.addr.data),
+                vc.get_ctrt_bal(recipient.addr.data),
+                vc.get_ctrt_bal(judge.addr.data),
+            ),
+            vc.apply_to_judge(payer, order_id),
         )
-        assert (await vc.get_order_status(order_id)) is True
+        await cft.wait_for_tx(api, resp["id"])
 
-        resp = await vc.apply_to_judge(payer, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
-
-        # The judge is dividing the amount that
-        # == payer_deposit + recipient_deposit - fee
-        # In this case, the amount is 8
-        to_payer = 3
-        to_rcpt = 5
+        to_payer = self.JUDGE_TO_PAYER
+        to_rcpt = self.JUDGE_TO_RCPT
 
         resp = await vc.do_judge(judge, order_id, to_payer, to_rcpt)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
-
-        assert (await vc.get_order_status(order_id)) is False
+        # The fee & judge deposit of an order never change, so read them while waiting.
+        _, (fee, judge_dep) = await cft.gather_bounded(
+            cft.wait_for_tx(api, resp["id"]),
+            cft.gather_bounded(
+                vc.get_order_fee(order_id),
+                vc.get_order_judge_deposit(order_id),
+            ),
+        )
 
-        fee, judge_dep, payer_bal, rcpt_bal, judge_bal = await asyncio.gather(
-            vc.get_order_fee(order_id),
-            vc.get_order_judge_deposit(order_id),
+        status, payer_bal, rcpt_bal, judge_bal = await cft.gather_bounded(
+            vc.get_order_status(order_id),
             vc.get_ctrt_bal(payer.addr.data),
             vc.get_ctrt_bal(recipient.addr.data),
             vc.get_ctrt_bal(judge.addr.data),
         )
+        assert status is False
 
         assert payer_bal.amount - payer_bal_old.amount == to_payer
         assert rcpt_bal.amount - rcpt_bal_old.amount == to_rcpt
@@ -820,15 +935,16 @@ class TestVEscrowCtrt:
             vc.get_ctrt_bal(judge.addr.data),
             vc.get_order_expiration_time(order_id),
         )
-        assert (await vc.get_order_status(order_id)) is True
+
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
         # Ensure that the recipient submit work grace period has expired.
         now = int(time.time())
         await asyncio.sleep(expire_at.unix_ts - now + cft.AVG_BLOCK_DELAY)
 
         resp = await vc.submit_penalty(payer, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
@@ -868,19 +984,19 @@ class TestVEscrowCtrt:
             vc.get_ctrt_bal(recipient.addr.data),
             vc.get_order_expiration_time(order_id),
         )
-        assert (await vc.get_order_status(order_id)) is True
+
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
         resp = await vc.apply_to_judge(payer, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         # Wait until the judge duration has exceeded.
         now = int(time.time())
         await asyncio.sleep(expire_at.unix_ts - now + cft.AVG_BLOCK_DELAY)
 
         resp = await vc.payer_refund(payer, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
@@ -916,19 +1032,19 @@ class TestVEscrowCtrt:
             vc.get_ctrt_bal(recipient.addr.data),
             vc.get_order_expiration_time(order_id),
         )
-        assert (await vc.get_order_status(order_id)) is True
+
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
         resp = await vc.apply_to_judge(payer, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         # Wait until the judge duration has exceeded.
         now = int(time.time())
         await asyncio.sleep(expire_at.unix_ts - now + cft.AVG_BLOCK_DELAY)
 
         resp = await vc.recipient_refund(recipient, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
@@ -964,14 +1080,15 @@ class TestVEscrowCtrt:
             vc.get_ctrt_bal(judge.addr.data),
             vc.get_order_expiration_time(order_id),
         )
-        assert (await vc.get_order_status(order_id)) is True
+
+        if cft.CHECK_INVARIANTS:
+            assert (await vc.get_order_status(order_id)) is True
 
         now = int(time.time())
         await asyncio.sleep(expire_at.unix_ts - now + cft.AVG_BLOCK_DELAY)
 
         resp = await vc.collect(recipient, order_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.wait_for_tx(api, resp["id"])
 
         assert (await vc.get_order_status(order_id)) is False
 
@@ -994,7 +1111,6 @@ class TestVEscrowCtrt:
         self,
         new_tok_ctrt: pv.TokCtrtWithoutSplit,
         new_ctrt: pv.VEscrowCtrt,
-        new_ctrt_quick_expire_order_deposited: Tuple[pv.VEscrowCtrt, str],
         maker: pv.Account,
         judge: pv.Account,
         payer: pv.Account,
@@ -1042,7 +1158,9 @@ class TestVEscrowCtrt:
             vc_with_order, payer, recipient, judge
         )
 
-        vc_with_order = new_ctrt_quick_expire_order_deposited
+        five_secs_later = int(time.time()) + 5
+        vc, order_id = await self._create_order(vc, payer, recipient, five_secs_later)
+        vc_with_order = await self._deposit_to_order(vc, order_id, recipient, judge)
         await self.test_submit_penalty(vc_with_order, payer, judge)
 
         expire_at = int(time.time()) + self.ORDER_PERIOD
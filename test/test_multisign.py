@@ -7,6 +7,7 @@ import pytest
 import axolotl_curve25519 as curve
 
 import py_vsys as pv
+from py_vsys import multisign as ms
 
 
 PRI_KEY_1 = "EV9ADJzYKZpk4MjxEkXxDSfRRSzBFnA9LEQNbepKZRFc"
@@ -109,3 +110,28 @@ def test_multisign_two_keys(
 
     valid = curve.verifySignature(mul_pub, MSG, mul_sig) == 0
     assert valid is True    
+
+
+@pytest.mark.parametrize("with_nacl", [True, False])
+def test_point_mul_base(
+    mulpk1: pv.MultiSignPriKey, with_nacl: bool, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    test_point_mul_base tests that the table-based & libsodium-based multiplications
+    of the base point match the generic point multiplication.
+
+    Args:
+        mulpk1 (pv.MultiSignPriKey): The pv.MultiSignPriKey for the private key.
+        with_nacl (bool): Whether to keep libsodium for _point_mul_base_compress.
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+    """
+    if with_nacl and ms._nacl is None:
+        pytest.skip("pynacl is not installed")
+    if not with_nacl:
+        monkeypatch.setattr(ms, "_nacl", None)
+
+    for s in (0, 1, 15, 16, mulpk1.a, pv.GROUP_ORDER_Q - 1, pv.GROUP_ORDER_Q + 7):
+        P = ms._point_mul_base(s)
+        Q = pv.point_mul(s, pv.G)
+        assert pv.point_equals(P, Q)
+        assert ms._point_mul_base_compress(s) == pv.point_compress(Q)